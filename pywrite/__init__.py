@@ -0,0 +1,3 @@
+# pywrite/__init__.py
+
+from ._version import __version__
@@ -0,0 +1,4 @@
+# Single source of truth for the package version; read textually by setup.py
+# so the build never imports the runtime package.
+
+__version__ = '1'
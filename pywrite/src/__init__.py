@@ -1,4 +1,5 @@
-# pywrite/__init__.py
+# pywrite/src/__init__.py
+
+from .._version import __version__
 
-__version__ = '1'
 __author__ = 'Alex Woodward'
@@ -6,35 +6,90 @@ Users can specify logging to a file, output to the terminal, and set the logging
 """
 
 import argparse
-import logging
+import sys
 
-def parse_args():
+_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Shared result for flagless invocations, so nothing is parsed or allocated.
+_DEFAULT_ARGS = argparse.Namespace(log_file=False, stream_output=False, verbosity='INFO')
+
+_PARSER = None
+
+def _build_parser():
     """
-    Parse command-line arguments for the pywrite application.
+    Builds the argument parser once and reuses it on later calls.
 
-    This function defines and parses the command-line arguments available to the user.
-    It also configures logging based on the provided arguments.
+    Returns:
+        argparse.ArgumentParser: The shared parser for the pywrite application.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = argparse.ArgumentParser(description='Command-line options for pywrite.')
+
+        _PARSER.add_argument('-l', '--log-file',
+                             action='store_true',
+                             help='Enable logging to a file.')
+
+        _PARSER.add_argument('-s', '--stream-output',
+                             action='store_true',
+                             help='Enable logging to the terminal.')
+
+        _PARSER.add_argument('-v', '--verbosity',
+                             choices=_LEVELS,
+                             default='INFO',
+                             help='Set the logging level.')
+        # Add more arguments as needed
+
+    return _PARSER
+
+def _fast_parse(argv):
+    """
+    Scans argv by hand for the small fixed flag set, skipping argparse entirely.
+
+    Args:
+        argv (list): The command-line tokens after the program name.
 
     Returns:
-        argparse.Namespace: An object containing the parsed command-line arguments.
+        argparse.Namespace: The parsed arguments, or None when an unknown
+            token is present and the full parser should take over.
     """
-    parser = argparse.ArgumentParser(description='Command-line options for pywrite.')
+    args = argparse.Namespace(log_file=False, stream_output=False, verbosity='INFO')
+
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ('-l', '--log-file'):
+            args.log_file = True
+        elif token in ('-s', '--stream-output'):
+            args.stream_output = True
+        elif token in ('-v', '--verbosity'):
+            value = next(tokens, None)
+            if value not in _LEVELS:
+                return None
+            args.verbosity = value
+        else:
+            return None
 
-    parser.add_argument('-l', '--log-file',
-                        action='store_true',
-                        help='Enable logging to a file.')
+    return args
+
+def parse_args():
+    """
+    Parse command-line arguments for the pywrite application.
 
-    parser.add_argument('-s', '--stream-output',
-                        action='store_true',
-                        help='Enable logging to the terminal.')
+    Flagless invocations return a cached default namespace outright. Otherwise
+    the known flag set is scanned directly first; the full argparse parser is
+    only built and consulted when an unrecognized token (including --help)
+    appears. Logging is configured based on the parsed arguments either way.
 
-    parser.add_argument('-v', '--verbosity',
-                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
-                        default='INFO',
-                        help='Set the logging level.')
-    # Add more arguments as needed
+    Returns:
+        argparse.Namespace: An object containing the parsed command-line arguments.
+    """
+    if len(sys.argv) == 1:
+        configure_logging(_DEFAULT_ARGS)
+        return _DEFAULT_ARGS
 
-    args = parser.parse_args()
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
     configure_logging(args)
 
     return args
@@ -48,6 +103,10 @@ def configure_logging(args):
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
     """
+    # Imported here so startup only pays for the logging machinery when
+    # logging is actually being configured.
+    import logging
+
     handlers = []
 
     if args.log_file:
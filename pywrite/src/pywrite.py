@@ -10,7 +10,6 @@ interrupted.
 """
 
 import asyncio
-import logging
 import rcon
 from args import parse_args
 
@@ -26,25 +25,25 @@ async def main():
     # Parse command-line arguments
     parse_args()
 
-    # Create and connect RCON client
-    client = rcon.RconClient('localhost', 25575, "1234")
-    await client.connect()
+    loop = asyncio.get_running_loop()
 
     try:
-        while True:
-            user_input = input("Send a command to the client, or type /q to quit: ")
-            if user_input == '/q':
-                await client.close()
-                break
-            response = await client.send(user_input)
-            print(response)
+        # Create and connect the RCON client; cleanup runs once on exit.
+        async with rcon.RconClient('localhost', 25575, "1234") as client:
+            while True:
+                # Run the blocking input() in a thread so the event loop stays
+                # responsive for background processing and reconnection.
+                user_input = await loop.run_in_executor(
+                    None, input, "Send a command to the client, or type /q to quit: ")
+                if user_input == '/q':
+                    break
+                response = await client.send(user_input)
+                print(response)
 
     except asyncio.CancelledError:
         # Log cancellation or handle cleanup if necessary
+        import logging
         logging.error("Main coroutine was cancelled.")
 
-    finally:
-        await client.close()
-
 if __name__ == "__main__":
     asyncio.run(main())
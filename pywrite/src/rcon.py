@@ -7,11 +7,65 @@ reconnection and task management for processing commands.
 """
 
 import asyncio
+import collections
 import os
 import struct
 import logging
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Maximum number of queued commands drained into a single socket write.
+MAX_BATCH = 64
+
+# Flush the outbound buffer once it grows beyond this many bytes.
+MAX_BUF = 8192
+
+# Pre-compiled packet header: length prefix, request ID, packet type.
+_PKT = struct.Struct('<iii')
+
+# Pre-compiled inbound length prefix and response header (request ID, packet type).
+_LEN = struct.Struct('<i')
+_HDR_IN = struct.Struct('<ii')
+
+class _RconProtocol(asyncio.Protocol):
+    """
+    A low-level protocol that frames RCON packets in place on the incoming buffer.
+
+    Incoming data is appended to a single bytearray; complete length-prefixed
+    packets are carved out and handed to the owning RconClient, so no
+    intermediate StreamReader buffering layer sits between the transport and
+    the client.
+    """
+    def __init__(self, client):
+        self._client = client
+        self._inbuf = bytearray()
+
+    def data_received(self, data):
+        """
+        Appends incoming data to the buffer and dispatches complete packets.
+
+        Args:
+            data (bytes): The chunk of data received from the transport.
+        """
+        buf = self._inbuf
+        buf += data
+        while len(buf) >= 4:
+            (length,) = _LEN.unpack_from(buf, 0)
+            end = 4 + length
+            if len(buf) < end:
+                break
+            self._client._packet_received(bytes(buf[4:end]))
+            del buf[:end]
+
+    def connection_lost(self, exc):
+        self._client._connection_lost(exc)
+
+    def pause_writing(self):
+        self._client._pause_writing()
+
+    def resume_writing(self):
+        self._client._resume_writing()
 
 class RconClient:
     """
@@ -26,9 +80,17 @@ class RconClient:
         port (int): The port number of the RCON server.
         password (str): The password used to authenticate with the RCON server.
         _active (bool): Indicates if the client is actively connected.
-        _reader (asyncio.StreamReader): The stream reader for the connection.
-        _writer (asyncio.StreamWriter): The stream writer for the connection.
-        _cmd_queue (asyncio.Queue): The queue for commands to be sent to the server.
+        _closed (bool): Set once cleanup has run, making further cleanups no-ops.
+        _loop (asyncio.AbstractEventLoop): The running loop, cached at connect time.
+        _dbg (bool): Whether DEBUG logging is enabled, cached at connect time.
+        _transport (asyncio.Transport): The transport for the connection.
+        _next_id (int): The next request ID to stamp on an outbound packet.
+        _in_flight (dict): Maps request IDs to their futures and buffered fragments.
+        _fences (dict): Maps fence packet IDs to the request IDs they terminate.
+        _can_write (asyncio.Event): Cleared while the transport applies write backpressure.
+        _cmd_queue (collections.deque): The queue for commands to be sent to the server.
+        _data_ready (asyncio.Event): Set whenever the queue holds commands to process.
+        _out_buf (bytearray): The buffer coalescing outbound packets between flushes.
         _process_task (asyncio.Task): The task responsible for processing commands.
     """
     def __init__(self,
@@ -47,10 +109,20 @@ class RconClient:
         self.port = port
         self.password = password
 
+        self._password_bytes = password.encode('utf8') if password else b''
         self._active: bool = False
-        self._reader: asyncio.StreamReader = None
-        self._writer: asyncio.StreamWriter = None
-        self._cmd_queue: asyncio.Queue[list] = asyncio.Queue()
+        self._closed: bool = False
+        self._loop: asyncio.AbstractEventLoop = None
+        self._dbg: bool = False
+        self._transport: asyncio.Transport = None
+        self._next_id: int = 0
+        self._in_flight: dict = {}
+        self._fences: dict = {}
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._cmd_queue: collections.deque = collections.deque()
+        self._data_ready = asyncio.Event()
+        self._out_buf = bytearray()
         self._process_task: asyncio.Task = None
 
     async def connect(self):
@@ -61,6 +133,9 @@ class RconClient:
         commands. It attempts to reconnect if the connection is not already established.
         """
         self._active = True
+        self._loop = asyncio.get_running_loop()
+        # Cached so hot paths skip the logger's level check per command.
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
         if not self._process_task:
             self._process_task = asyncio.create_task(self._process())
             logger.info('Creating processing task: %s.', self._process_task)
@@ -80,9 +155,11 @@ class RconClient:
         Returns:
             str: The server's response to the command.
         """
-        future = asyncio.Future()
-        await self._cmd_queue.put((cmd, future))
-        logger.debug('Queueing command "%s" to %s:%d.', cmd, self.host, self.port)
+        future = self._loop.create_future()
+        self._cmd_queue.append((cmd, future))
+        self._data_ready.set()
+        if self._dbg:
+            logger.debug('Queueing command "%s" to %s:%d.', cmd, self.host, self.port)
         return await future
 
     async def close(self, err_type=None, err_val=None):
@@ -98,26 +175,45 @@ class RconClient:
         """
         await self._cleanup(err_type, err_val)
 
+    async def __aenter__(self):
+        """
+        Connects the client on entry to an ``async with`` block.
+
+        Returns:
+            RconClient: The connected client.
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, err_type, err_val, traceback):
+        """
+        Cleans up the connection on exit from an ``async with`` block.
+
+        Exceptions raised inside the block propagate unchanged after cleanup.
+        """
+        await self._cleanup()
+
     async def _reconnect(self):
         """
         Attempts to reconnect to the RCON server.
 
-        This method tries to establish a connection to the server, retrying up to 5 times if
-        it fails. If the connection cannot be established after 5 attempts, it triggers cleanup.
+        This method tries to establish a connection to the server, retrying with truncated
+        exponential backoff (100 ms doubling up to 5 s). If the connection cannot be
+        established after 6 attempts, it triggers cleanup.
         """
-        attempt = 0
-        while True:
+        delay = 0.1
+        for _ in range(6):
             try:
-                if not self._writer:
-                    self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
-                    await self._login()
-                    break
+                loop = asyncio.get_running_loop()
+                self._transport, _ = await loop.create_connection(
+                    lambda: _RconProtocol(self), self.host, self.port)
+                await self._login()
+                return
             except (ConnectionError, OSError) as e:
-                if attempt == 5:
-                    await self._cleanup(ConnectionError, "Unable to reconnect.")
-                logger.error('Connection error: %s. Retrying in 5 seconds...', e)
-                attempt += 1
-            await asyncio.sleep(5)
+                logger.error('Connection error: %s. Retrying in %.1f seconds...', e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 5.0)
+        await self._cleanup(ConnectionError, "Unable to reconnect.")
 
     async def _login(self):
         """
@@ -126,56 +222,192 @@ class RconClient:
         This method sends the login command to the server and verifies the connection.
         Logs a message if the connection is successful.
         """
-        if await self._send(self.password, 3):
+        if await self._send_raw(self._password_bytes, 3):
             logger.info('Successfully connected to %s:%d.', self.host, self.port)
 
-    async def _read(self, len_b):
-        """
-        Reads a specified number of bytes from the server.
-
-        This method continues reading data until the specified length is reached.
-
-        Args:
-            len_b (int): The number of bytes to read from the stream.
-
-        Returns:
-            bytes: The data read from the server.
-        """
-        data = b''
-        while len(data) < len_b:
-            data += await self._reader.read(len_b - len(data))
-        return data
-
     async def _process(self):
         """
         Processes commands from the command queue and sends them to the server.
 
-        This method runs in a loop as long as the client is active, handling queued commands, 
-        sending them to the server, and managing responses.
+        This method runs in a loop as long as the client is active. Queued commands are
+        drained opportunistically (up to MAX_BATCH at a time) and written out together,
+        each stamped with a distinct request ID and followed by an empty fence packet;
+        responses are matched to their futures out of order as they arrive, so many
+        commands can be in flight at once.
         """
         while self._active:
             try:
-                command, future = await self._cmd_queue.get()
-                result = await self._send(command)
-                future.set_result(result)
-                self._cmd_queue.task_done()
+                if not self._cmd_queue:
+                    self._data_ready.clear()
+                    await self._data_ready.wait()
+
+                batch = []
+                while self._cmd_queue and len(batch) < MAX_BATCH:
+                    batch.append(self._cmd_queue.popleft())
+
+                for cmd, future in batch:
+                    self._pack_request(cmd.encode('utf8'), future)
+                    if len(self._out_buf) >= MAX_BUF:
+                        await self._flush()
+                await self._flush()
+                if self._dbg:
+                    logger.debug('Sent batch of %d command(s) to %s:%d.',
+                                 len(batch), self.host, self.port)
 
             except asyncio.CancelledError:
                 pass
 
-            except ValueError as e:
-                logger.error('RCON error: %s', e)
-
             except (ConnectionError, OSError):
                 logger.error('Connection lost. Attempting to reconnect...')
-                await self._reconnect()
+                # Discard anything packed for the dead connection — both the
+                # buffered bytes and their response-matching entries — so the
+                # new connection's first bytes are the auth packet, not a
+                # replay of stale commands ahead of it.
+                self._out_buf = bytearray()
+                self._fail_in_flight(ConnectionError, "Connection lost.")
+                try:
+                    await self._reconnect()
+                except (ConnectionError, ValueError) as e:
+                    # _cleanup has already closed the client and failed the
+                    # affected futures; re-raising here would only kill this
+                    # background task with an unretrieved exception. Callers
+                    # awaiting connect() directly still see the raise.
+                    logger.error('Unable to restore the connection: %s', e)
+
+    def _pack_request(self, body: bytes, future, cmd_type=2, fenced=True):
+        """
+        Registers a request for response matching and packs it into the
+        outbound buffer.
 
-    async def _send(self, cmd: str, cmd_type=2):
+        A trailing empty "fence" packet with the next ID is appended after the
+        command; the server answers packets in order, so the fence's response
+        marks the end of a possibly multi-packet command response.
+
+        Args:
+            body (bytes): The encoded command payload.
+            future (asyncio.Future): The future to resolve with the response.
+            cmd_type (int, optional): The type of RCON packet to build. Defaults to 2.
+            fenced (bool, optional): Whether to append a fence packet. Single-packet
+                exchanges such as login resolve on their first response instead.
+        """
+        req_id = self._next_id
+        self._next_id = (self._next_id + 2) & 0x7fffffff
+
+        self._pack(self._out_buf, body, req_id, cmd_type)
+        if fenced:
+            self._in_flight[req_id] = (future, [])
+            self._fences[req_id + 1] = req_id
+            self._pack(self._out_buf, b'', req_id + 1, 0)
+        else:
+            self._in_flight[req_id] = (future, None)
+
+    def _pack(self, buf: bytearray, body: bytes, req_id: int, cmd_type=2):
         """
-        Sends a command to the RCON server and waits for the response.
+        Packs a length-prefixed RCON packet onto the end of an existing buffer.
 
-        This method constructs the command packet, sends it to the server, and reads the response.
-        It also verifies the response packet to ensure it is valid.
+        Writing the header and body straight into the shared outbound buffer
+        avoids materializing a separate packet object per command.
+
+        Args:
+            buf (bytearray): The buffer to append the packet to.
+            body (bytes): The encoded command payload to pack.
+            req_id (int): The request ID to stamp on the packet.
+            cmd_type (int, optional): The type of RCON packet to build. Defaults to 2.
+        """
+        offset = len(buf)
+        total = 10 + len(body)
+        buf.extend(bytes(4 + total))
+        _PKT.pack_into(buf, offset, total, req_id, cmd_type)
+        buf[offset + 12:offset + 12 + len(body)] = body
+        # The two trailing NUL padding bytes are already zero from the extension.
+
+    async def _flush(self):
+        """
+        Flushes the outbound buffer to the server in a single write.
+
+        Coalescing packets in the buffer and flushing once per batch keeps the
+        number of socket writes and TCP segments low under load.
+        """
+        if self._out_buf:
+            if self._transport is None:
+                raise ConnectionError("Connection lost.")
+            self._transport.write(self._out_buf)
+            self._out_buf = bytearray()
+            await self._can_write.wait()
+
+    def _packet_received(self, in_pkt):
+        """
+        Matches a framed packet from the protocol to its in-flight request.
+
+        Fragments of a fenced request accumulate until the fence's response
+        arrives; unfenced requests resolve on their first packet. Packets with
+        an unknown ID are discarded.
+
+        Args:
+            in_pkt (bytes): The framed packet, without its length prefix.
+        """
+        try:
+            in_id, in_data = self._verify(in_pkt)
+        except ValueError as e:
+            logger.error('RCON error: %s', e)
+            self._fail_in_flight(ValueError, str(e))
+            return
+
+        if in_id in self._fences:
+            req_id = self._fences.pop(in_id)
+            future, parts = self._in_flight.pop(req_id)
+            if not future.done():
+                future.set_result(''.join(parts))
+        elif in_id in self._in_flight:
+            future, parts = self._in_flight[in_id]
+            if parts is None:
+                del self._in_flight[in_id]
+                if not future.done():
+                    future.set_result(str(in_data, 'utf8'))
+            else:
+                parts.append(str(in_data, 'utf8'))
+        else:
+            logger.warning('Discarding packet with unknown ID %d.', in_id)
+
+    def _fail_in_flight(self, err_type, err_val):
+        """
+        Fails every in-flight request with the given error.
+
+        Args:
+            err_type (Exception): The type of exception to set on the futures.
+            err_val (str): The error message associated with the exception.
+        """
+        self._fences.clear()
+        while self._in_flight:
+            _, (future, _) = self._in_flight.popitem()
+            if not future.done():
+                future.set_exception(err_type(err_val))
+
+    def _connection_lost(self, exc):
+        """
+        Handles the transport dropping, failing any requests still in flight.
+
+        Args:
+            exc (Exception): The cause of the loss, or None on a clean close.
+        """
+        if exc:
+            logger.error('Connection dropped: %s', exc)
+        self._transport = None
+        self._can_write.set()
+        # Invalidate any bytes coalesced but not yet flushed; they belong to
+        # the dead connection and must not leak onto the next one.
+        self._out_buf = bytearray()
+        self._fail_in_flight(ConnectionError, "Connection lost.")
+
+    def _pause_writing(self):
+        self._can_write.clear()
+
+    def _resume_writing(self):
+        self._can_write.set()
+
+    async def _send(self, cmd: str, cmd_type=2):
+        """
+        Sends a single command string to the RCON server and waits for the response.
 
         Args:
             cmd (str): The command string to send to the server.
@@ -184,33 +416,51 @@ class RconClient:
         Returns:
             str: The decoded response data from the server.
         """
-        out_packet = struct.pack('<li', 0, cmd_type) + cmd.encode('utf8') + b'\x00\x00'
-        out_len = struct.pack('<i', len(out_packet))
-        self._writer.write(out_len + out_packet)
-        logger.debug('Command "%s" sent to %s:%d.', cmd, self.host, self.port)
+        return await self._send_raw(cmd.encode('utf8'), cmd_type)
 
-        in_length = struct.unpack('<i', await self._read(4))
-        in_packet = await self._read(in_length[0])
+    async def _send_raw(self, payload: bytes, cmd_type=2):
+        """
+        Sends a single pre-encoded payload to the RCON server and waits for the response.
 
-        logger.debug('Received response: %s', in_packet)
-        data = await self._verify(in_packet)
+        This method constructs the command packet, sends it to the server, and reads the response.
+        It also verifies the response packet to ensure it is valid.
 
-        return data.decode('utf8')
+        Args:
+            payload (bytes): The encoded payload to send to the server.
+            cmd_type (int, optional): The type of RCON packet to send. Defaults to 2.
+
+        Returns:
+            str: The decoded response data from the server.
+        """
+        future = self._loop.create_future()
+        self._pack_request(payload, future, cmd_type, fenced=False)
+        await self._flush()
+        logger.debug('Payload "%s" sent to %s:%d.', payload, self.host, self.port)
+
+        try:
+            return await future
+        except ValueError as e:
+            await self._cleanup(ValueError, str(e))
 
     async def _cleanup(self, err_type=None, err_val=None):
         """
         Private method to close the connection and clean up resources.
 
-        This method ensures that the connection is properly closed, and any active tasks 
-        are cancelled. It logs the closure and raises any specified errors.
+        This method ensures that the connection is properly closed, and any active tasks
+        are cancelled. It logs the closure and raises any specified errors. Cleanup runs
+        at most once; repeated calls return immediately.
 
         Args:
             err_type (Exception, optional): The type of exception to raise after cleanup.
             err_val (str, optional): The error message associated with the exception.
         """
-        if self._writer:
-            self._writer.close()
-            await self._writer.wait_closed()
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._transport:
+            self._transport.close()
+            self._transport = None
         if self._process_task:
             self._process_task.cancel()
         self._active = False
@@ -219,29 +469,29 @@ class RconClient:
         if err_type:
             raise err_type(err_val)
 
-    async def _verify(self, in_pkt):
+    def _verify(self, in_pkt):
         """
         Verifies the response packet from the server.
 
-        This method checks the packet ID, type, and padding to ensure it is valid.
-        If the packet is invalid, it triggers cleanup and raises an appropriate error.
+        This method checks the packet ID and padding to ensure it is valid.
 
         Args:
             in_pkt (bytes): The response packet from the server.
 
         Returns:
-            bytes: The data extracted from the packet.
+            tuple: The request ID echoed by the server and a memoryview over
+                the data portion of the packet, sliced without copying.
 
         Raises:
             ValueError: If the packet is invalid or the ID is incorrect.
         """
-        in_id, in_type = struct.unpack('<ii', in_pkt[:8])
-        in_data, in_padd = in_pkt[8:-2], in_pkt[-2:]
+        mv = memoryview(in_pkt)
+        in_id, in_type = _HDR_IN.unpack_from(mv, 0)
 
         if in_id == -1:
-            await self._cleanup(ValueError, "Incorrect password.")
+            raise ValueError("Incorrect password.")
 
-        if in_padd != b'\x00\x00':
-            await self._cleanup(ValueError, "Invalid padding.")
+        if mv[-2] | mv[-1]:
+            raise ValueError("Invalid padding.")
 
-        return in_data
+        return in_id, mv[8:-2]